@@ -0,0 +1,434 @@
+import functools
+import os
+import tempfile
+import threading
+import streamlit as st
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# --------------------------------------------------
+# Shared data layer for every page: the cached trip frame
+# and the small pre-aggregated tables the pages slice.
+# --------------------------------------------------
+DATA_CSV = "citibike_weather_sample.csv"
+CATEGORY_COLS = ["start_station_name", "end_station_name", "member_casual", "rideable_type"]
+WEATHER_COLS = ["TMAX", "TMIN", "PRCP"]
+COORD_COLS = ["start_lat", "start_lng", "end_lat", "end_lng"]
+# columns any page reads; everything else (ride ids, station ids, ...) stays on disk
+USED_COLS = [
+    "started_at",
+    "start_station_name", "end_station_name", "member_casual",
+    "start_lat", "start_lng", "end_lat", "end_lng",
+    "TMAX", "TMIN", "PRCP",
+]
+# added by load_data(); not part of the dataset itself
+DERIVED_COLS = ["date", "hour", "month", "avg_temp"]
+# sliders never ask for more than this many top stations/routes
+TOP_N_MAX = 30
+# sessions run on separate threads; only one of them builds the Parquet copy
+_DATA_LOCK = threading.Lock()
+# mtime of the data file the cached results in this process were built from
+_data_version = None
+# typed frames whose Parquet copy couldn't be written (read-only app directory),
+# keyed by (CSV path, CSV mtime)
+_memory_copies = {}
+
+
+# --------------------------------------------------
+# Load reduced sample dataset
+# --------------------------------------------------
+def _read_csv_arrow(csv_path, columns):
+    """
+    Read the given CSV columns with Arrow's multithreaded parser, typing them
+    up front (timestamps, float32 weather and coordinates, dictionary-encoded
+    categoricals). Other columns are skipped without being converted.
+    """
+    column_types = {"started_at": pa.timestamp("ms")}
+    column_types.update({col: pa.float32() for col in WEATHER_COLS + COORD_COLS})
+    column_types.update({col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORY_COLS})
+
+    convert = pacsv.ConvertOptions(
+        column_types=column_types,
+        include_columns=columns,
+        strings_can_be_null=True,
+    )
+    return pacsv.read_csv(csv_path, convert_options=convert).to_pandas()
+
+
+def _ensure_parquet(csv_path):
+    """
+    Return the typed Parquet copy of the CSV next to it, building it on the
+    first run and again whenever the CSV is newer than the Parquet file or
+    the file was written with other column types (e.g. by an older version).
+    Concurrent sessions wait on _DATA_LOCK instead of building in parallel.
+    Returns None if the copy can't be written; the typed frame is then kept
+    in _memory_copies instead.
+    """
+    csv_path = Path(csv_path)
+    parquet_path = csv_path.with_suffix(".parquet")
+    with _DATA_LOCK:
+        if _parquet_is_current(csv_path, parquet_path):
+            return parquet_path
+        key = (str(csv_path), csv_path.stat().st_mtime)
+        if key in _memory_copies:
+            return None
+
+        df = _typed_frame(csv_path)
+        try:
+            _write_parquet(df, parquet_path)
+        except OSError:
+            # read-only deploy: slower loads, but the pages still render
+            _memory_copies.clear()
+            _memory_copies[key] = df
+            return None
+    return parquet_path
+
+
+def _parquet_is_current(csv_path, parquet_path):
+    if not parquet_path.exists():
+        return False
+    mtime = parquet_path.stat().st_mtime
+    return mtime >= csv_path.stat().st_mtime and _has_built_types(str(parquet_path), mtime)
+
+
+@functools.lru_cache(maxsize=4)
+def _has_built_types(parquet_path, mtime):
+    """
+    Whether the Parquet columns carry the types _typed_frame produces.
+    Only the footer is read, once per file version (mtime is part of the key).
+    """
+    for field in pq.read_schema(parquet_path):
+        if field.name == "started_at":
+            ok = pa.types.is_timestamp(field.type)
+        elif field.name in CATEGORY_COLS:
+            ok = pa.types.is_dictionary(field.type)
+        elif field.name in WEATHER_COLS + COORD_COLS:
+            ok = pa.types.is_float32(field.type)
+        else:
+            continue
+        if not ok:
+            return False
+    return True
+
+
+def _csv_header(csv_path):
+    return pd.read_csv(csv_path, nrows=0).columns
+
+
+def _typed_frame(csv_path):
+    """
+    Parse the USED_COLS columns present in the CSV.
+    Columns are typed here, whichever parser read the CSV: datetime64
+    started_at, float32 weather and coordinates, categorical names and rider type.
+    """
+    header = _csv_header(csv_path)
+    columns = [c for c in USED_COLS if c in header]
+    try:
+        df = _read_csv_arrow(csv_path, columns)
+    except pa.ArrowInvalid:
+        # malformed values: fall back to pandas' more forgiving parser
+        df = pd.read_csv(csv_path, usecols=columns, low_memory=False)[columns]
+    if "started_at" in df.columns:
+        df["started_at"] = pd.to_datetime(df["started_at"], errors="coerce")
+        # chronological order keeps every per-day table and date slice contiguous
+        df = df.sort_values("started_at", kind="mergesort").reset_index(drop=True)
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype(pd.CategoricalDtype())
+    # float32 is plenty for weather readings and coordinates (~1 m) and halves their memory
+    float_cols = [c for c in WEATHER_COLS + COORD_COLS if c in df.columns]
+    if float_cols:
+        df[float_cols] = df[float_cols].apply(pd.to_numeric, errors="coerce", downcast="float")
+    return df
+
+
+def _write_parquet(df, parquet_path):
+    # write to a unique temp file first so a concurrent reader never opens a partial file
+    fd, tmp_path = tempfile.mkstemp(
+        dir=parquet_path.parent, prefix=parquet_path.stem + ".", suffix=".parquet.tmp"
+    )
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp_path, parquet_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_data():
+    """
+    Load the trip sample with every derived column the pages need.
+    Every session gets the same frame object, so treat it as read-only.
+    """
+    global _data_version
+    source = _ensure_parquet(DATA_CSV) or Path(DATA_CSV)
+    mtime = source.stat().st_mtime
+    with _DATA_LOCK:
+        if _data_version is not None and mtime != _data_version:
+            # the aggregates below (and the Kepler map) are keyed on their own
+            # arguments only, so drop everything built from the old copy
+            st.cache_data.clear()
+            st.cache_resource.clear()
+        _data_version = mtime
+    return _shared_frame(str(source), mtime)
+
+
+@st.cache_resource
+def _shared_frame(source_path, mtime):
+    # cache_data hands out a fresh unpickled copy per call; this keeps one per data version
+    return _load_prepared(source_path, mtime)
+
+
+@st.cache_data(persist="disk")
+def _load_prepared(source_path, mtime):
+    """
+    Read the Parquet copy (already typed and sorted by _typed_frame), or the
+    in-memory typed frame if the copy couldn't be written, and derive the
+    shared columns.
+    Persisted to disk, so a restarted server skips this work; mtime is
+    part of the cache key, so a rebuilt Parquet file is read again.
+    """
+    typed = _memory_copies.get((source_path, mtime))
+    if typed is not None:
+        df = typed.copy()
+    else:
+        available = pq.read_schema(source_path).names
+        df = pd.read_parquet(
+            source_path,
+            engine="pyarrow",
+            columns=[c for c in USED_COLS if c in available],
+        )
+
+    # time pages check for started_at themselves; the others don't need it
+    if "started_at" in df.columns:
+        # unparseable start times were coerced to NaT (sorted last) at build time
+        df = df.dropna(subset=["started_at"]).reset_index(drop=True)
+        df["date"] = df["started_at"].dt.floor("D")
+        df["hour"] = df["started_at"].dt.hour.astype("int8")
+        df["month"] = df["started_at"].dt.month.astype("int8")
+
+    if "TMAX" in df.columns and "TMIN" in df.columns:
+        # one float32 buffer, no intermediate Series
+        avg_temp = np.add(df["TMAX"].to_numpy(), df["TMIN"].to_numpy(), dtype=np.float32)
+        avg_temp *= np.float32(0.5)
+        df["avg_temp"] = avg_temp
+
+    if "start_station_name" in df.columns and "end_station_name" in df.columns:
+        # one shared station vocabulary, so start/end codes can be compared directly
+        stations = pd.CategoricalDtype(
+            df["start_station_name"].cat.categories.union(df["end_station_name"].cat.categories)
+        )
+        df["start_station_name"] = df["start_station_name"].astype(stations)
+        df["end_station_name"] = df["end_station_name"].astype(stations)
+
+    return df
+
+
+# --------------------------------------------------
+# Cached aggregates (computed once per rider type, sliced by the pages)
+# --------------------------------------------------
+@st.cache_data
+def dataset_columns():
+    """Column names of the source CSV (the loaded frame keeps only USED_COLS)."""
+    return list(_csv_header(DATA_CSV))
+
+
+@st.cache_data
+def overview_preview(n=20):
+    """
+    First n trips for the Overview table, without the derived columns.
+    Categorical columns become plain values, so the preview doesn't ship
+    every station name to the browser.
+    """
+    preview = load_data().head(n).drop(columns=DERIVED_COLS, errors="ignore").reset_index(drop=True)
+    categorical = preview.select_dtypes("category").columns
+    return preview.astype({col: object for col in categorical})
+
+
+def _rider_rows(data, rider):
+    if rider != "All" and "member_casual" in data.columns:
+        return data[data["member_casual"] == rider]
+    return data
+
+
+def day_range(start_d, end_d):
+    """
+    Date-picker bounds as a datetime64 label slice over the daily index.
+    The index is sorted, so .loc resolves it with two binary searches
+    instead of building a boolean mask.
+    """
+    return slice(pd.Timestamp(start_d), pd.Timestamp(end_d))
+
+
+def _station_rows(rider, complete_only=True):
+    """Trips with a start station (and an end station if complete_only)."""
+    subset = ["start_station_name", "end_station_name"] if complete_only else ["start_station_name"]
+    return _rider_rows(load_data(), rider).dropna(subset=subset)
+
+
+@st.cache_data
+def hourly_counts(rider="All"):
+    """Trips per day and hour of day (rows: date, columns: 0-23)."""
+    rows = _rider_rows(load_data(), rider)
+    day_codes, days = pd.factorize(rows["date"], sort=True)
+
+    # dense small-int keys: one bincount over day * 24 + hour, no hash table
+    keys = day_codes.astype(np.int64)
+    keys *= 24
+    keys += rows["hour"].to_numpy()
+    counts = np.bincount(keys, minlength=len(days) * 24).reshape(len(days), 24)
+    return pd.DataFrame(
+        counts,
+        index=pd.DatetimeIndex(days, name="date"),
+        columns=pd.RangeIndex(24, name="hour"),
+    )
+
+
+@st.cache_data
+def daily_counts(rider="All"):
+    """Trips per day (Series indexed by date)."""
+    return hourly_counts(rider).sum(axis=1).rename("trip_count")
+
+
+def monthly_totals(daily):
+    """Sum a per-day Series into calendar months 1..12 (missing months are 0)."""
+    totals = np.bincount(daily.index.month, weights=daily.to_numpy(np.float64), minlength=13)[1:]
+    return pd.Series(totals.astype(np.int64), index=range(1, 13))
+
+
+@st.cache_data(max_entries=32)
+def trip_trends(start_d, end_d, rider="All"):
+    """
+    Daily, monthly (1..12) and hourly (0-23) trip counts for a date range.
+    Keyed on the picker values, so returning to a recent range is a cache hit.
+    """
+    days = day_range(start_d, end_d)
+    daily = daily_counts(rider).loc[days]
+    return daily, monthly_totals(daily), hourly_counts(rider).loc[days].sum()
+
+
+@st.cache_data
+def _valid_rows(cols):
+    """Rows with a value in every one of cols (one mask, shared by all rider filters)."""
+    data = load_data()
+    valid = np.ones(len(data), dtype=bool)
+    for col in cols:
+        np.logical_and(valid, data[col].notna().to_numpy(), out=valid)
+    return valid
+
+
+def _daily_agg(rider, cols, **aggs):
+    """Daily trip count plus aggs, over the rider's trips with a value in every one of cols."""
+    # date is never missing: the loader drops trips without a start time
+    rows = _rider_rows(load_data()[_valid_rows(cols)], rider)
+
+    # rows are in time order, so groups already come out by date; skip the key sort
+    return rows.groupby("date", sort=False, observed=True).agg(trip_count=("date", "size"), **aggs)
+
+
+@st.cache_data
+def daily_temperature(rider="All"):
+    """Daily trip count and average temperature, indexed by date (needs only TMAX/TMIN)."""
+    return _daily_agg(rider, ("TMAX", "TMIN"), avg_temp=("avg_temp", "mean"))
+
+
+@st.cache_data
+def daily_weather(rider="All"):
+    """Daily trip count, average temperature and precipitation, indexed by date."""
+    return _daily_agg(rider, tuple(WEATHER_COLS), avg_temp=("avg_temp", "mean"), prcp=("PRCP", "mean"))
+
+
+def _rank_top(counts, n=TOP_N_MAX):
+    """
+    Reorder counts so the first n entries are the largest, in descending order.
+    np.argpartition selects them in O(U) instead of sorting every count;
+    the remaining entries follow in their original order.
+    """
+    values = counts.to_numpy()
+    if len(values) <= n:
+        return counts.sort_values(ascending=False, kind="stable")
+
+    top = np.argpartition(values, -n)[-n:]
+    top = top[np.argsort(-values[top], kind="stable")]
+    rest = np.ones(len(values), dtype=bool)
+    rest[top] = False
+    return counts.iloc[np.concatenate([top, np.flatnonzero(rest)])]
+
+
+def _observed_counts(values):
+    # categorical value_counts also lists unused categories; keep only observed ones
+    counts = values.value_counts(sort=False)
+    return _rank_top(counts[counts > 0])
+
+
+@st.cache_data
+def start_station_counts(rider="All", complete_only=True):
+    """Trips started per station; the first TOP_N_MAX are ranked most popular first."""
+    return _observed_counts(_station_rows(rider, complete_only)["start_station_name"])
+
+
+@st.cache_data
+def end_station_counts(rider="All"):
+    """Trips ended per station; the first TOP_N_MAX are ranked most popular first."""
+    return _observed_counts(_station_rows(rider)["end_station_name"])
+
+
+@st.cache_data
+def station_names():
+    """The shared start/end station categories (code -> name)."""
+    return load_data()["start_station_name"].cat.categories
+
+
+@st.cache_data
+def route_counts(rider="All"):
+    """
+    Trips per route, indexed by a packed integer key
+    (start_code * n_stations + end_code); the first TOP_N_MAX are ranked
+    most frequent first. Use route_labels() for display.
+    """
+    rows = _station_rows(rider)
+    n_stations = len(rows["start_station_name"].cat.categories)
+    keys = rows["start_station_name"].cat.codes.to_numpy(np.int64)
+    keys *= n_stations
+    keys += rows["end_station_name"].cat.codes.to_numpy()
+    # hash-count the int64 keys in one O(N) pass (no sort, no n_stations**2 bins)
+    return _rank_top(pd.Series(keys).value_counts(sort=False))
+
+
+def route_labels(keys):
+    """Turn packed route keys back into "start → end" labels."""
+    stations = station_names()
+    start, end = np.divmod(np.asarray(keys, dtype=np.int64), len(stations))
+    return [f"{stations[s]} → {stations[e]}" for s, e in zip(start, end)]
+
+
+@st.cache_data
+def station_balance():
+    """Starts, ends and net balance (starts - ends) per station."""
+    rows = _station_rows("All")
+    stations = rows["start_station_name"].cat.categories
+
+    # both columns share the station categories, so the code counts line up
+    starts = np.bincount(rows["start_station_name"].cat.codes.to_numpy(), minlength=len(stations))
+    ends = np.bincount(rows["end_station_name"].cat.codes.to_numpy(), minlength=len(stations))
+
+    balance_df = pd.DataFrame({
+        "station": stations,
+        "starts": starts,
+        "ends": ends,
+        "net_balance": starts - ends,
+    })
+    return balance_df[(starts > 0) | (ends > 0)].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    # one-time build step (e.g. at deploy time): python data.py
+    parquet_path = _ensure_parquet(DATA_CSV)
+    if parquet_path is None:
+        raise SystemExit(f"Could not write a Parquet copy next to {DATA_CSV}")
+    print(f"Wrote {parquet_path}")
@@ -0,0 +1,20 @@
+import streamlit as st
+
+from data import load_data, overview_preview, dataset_columns
+from ui import setup_page
+
+setup_page()
+df = load_data()
+
+# --------------------------------------------------
+# Overview Page
+# --------------------------------------------------
+st.title("Overview")
+st.write("Preview of the reduced Citi Bike dataset:")
+st.dataframe(overview_preview(), use_container_width=True)
+
+col1, col2 = st.columns(2)
+with col1:
+    st.metric("Number of Rows", f"{len(df):,}")
+with col2:
+    st.metric("Number of Columns", f"{len(dataset_columns()):,}")
@@ -0,0 +1,62 @@
+import streamlit as st
+
+from data import load_data, daily_counts, trip_trends
+from ui import setup_page, st_bar
+
+setup_page()
+df = load_data()
+
+# --------------------------------------------------
+# Trips & Time Trends Page
+# --------------------------------------------------
+st.title("Trips & Time Trends")
+st.write("This page shows daily, monthly, and hourly trip patterns.")
+
+if "started_at" not in df.columns:
+    st.error("Missing required column: started_at")
+    st.stop()
+
+all_days = daily_counts().index
+min_date = all_days.min().date()
+max_date = all_days.max().date()
+
+start_d, end_d = st.sidebar.date_input(
+    "Date range (Trips page)",
+    value=(min_date, max_date),
+    min_value=min_date,
+    max_value=max_date,
+)
+
+rider_filter = "All"
+if "member_casual" in df.columns:
+    rider_filter = st.sidebar.selectbox("Rider type (Trips page)", ["All", "member", "casual"])
+
+# sliced from the cached per-day tables; months are 1..12, hours 0-23
+daily, monthly, hourly = trip_trends(start_d, end_d, rider_filter)
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Trips (filtered)", f"{daily.sum():,}")
+col2.metric("Avg trips / day", f"{daily.mean():,.0f}" if len(daily) else "0")
+col3.metric("Peak hour", f"{int(hourly.idxmax()):02d}:00" if hourly.sum() else "N/A")
+
+st.subheader("Daily Trip Volume")
+st.line_chart(daily.rename("Trips"))
+
+st.subheader("Trips by Month")
+month_names = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
+st_bar([month_names[m-1] for m in monthly.index], monthly.to_numpy(), "Month", "Trips")
+
+st.subheader("Trips by Hour of Day")
+st_bar(hourly.index, hourly.to_numpy(), "Hour (0–23)", "Trips")
+
+with st.expander("Interpretation"):
+    st.markdown(
+        """
+        The daily trend shows demand fluctuations with peaks that indicate higher ridership periods,
+        which can increase pressure on bike availability at popular stations.
+
+        Monthly patterns suggest seasonality, with higher ridership in warmer months and lower demand
+        in colder periods. Hourly patterns reveal demand concentrations at specific times, which is
+        useful for planning **rebalancing operations** and staffing.
+        """
+    )
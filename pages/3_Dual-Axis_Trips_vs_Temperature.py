@@ -0,0 +1,42 @@
+import streamlit as st
+
+from data import load_data, daily_temperature
+from ui import setup_page, st_dual_axis
+
+setup_page()
+df = load_data()
+
+# --------------------------------------------------
+# Dual-Axis Page
+# --------------------------------------------------
+st.title("Trips vs Temperature Over Time")
+st.write(
+    "This chart compares daily trip volume with average daily temperature "
+    "to highlight seasonal and weather-related patterns."
+)
+
+required_cols = ["started_at", "TMAX", "TMIN"]
+missing = [c for c in required_cols if c not in df.columns]
+if missing:
+    st.error(f"Missing required columns: {', '.join(missing)}")
+    st.stop()
+
+daily_summary = daily_temperature()
+
+st_dual_axis(
+    daily_summary.index,
+    daily_summary["trip_count"],
+    daily_summary["avg_temp"],
+    "Trips",
+    "Avg Temperature",
+    height=500
+)
+
+with st.expander("Interpretation"):
+    st.markdown(
+        """
+        Trip volume generally rises as average temperatures increase, suggesting stronger ridership
+        during warmer periods. Colder conditions correspond with reduced usage. This supports using
+        seasonal forecasting to guide operations and availability planning.
+        """
+    )
@@ -0,0 +1,42 @@
+import streamlit as st
+
+from data import load_data, start_station_counts, TOP_N_MAX
+from ui import setup_page, st_barh
+
+setup_page()
+df = load_data()
+
+# --------------------------------------------------
+# Popular Stations Page
+# --------------------------------------------------
+st.title("Most Popular Starting Stations")
+st.write("Stations with the highest number of trip starts in the dataset.")
+
+if "start_station_name" not in df.columns:
+    st.error("Missing required column: start_station_name")
+    st.stop()
+
+top_n = st.sidebar.slider("Number of stations to display", 5, TOP_N_MAX, 10)
+
+top_stations = (
+    start_station_counts(complete_only=False)
+    .head(top_n)
+    .iloc[::-1]
+)
+
+st_barh(
+    top_stations.index,
+    top_stations.to_numpy(),
+    "Number of Trips Started",
+    y_label="Starting Station",
+    title=f"Top {top_n} Starting Stations",
+)
+
+with st.expander("Interpretation"):
+    st.markdown(
+        f"""
+        The top {top_n} starting stations represent key demand hubs where riders frequently begin trips.
+        These stations are priority targets for rebalancing and dock capacity planning to prevent shortages
+        during peak hours.
+        """
+    )
@@ -0,0 +1,81 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+
+from data import load_data, daily_weather, day_range
+from ui import setup_page, st_mpl, st_dual_axis
+
+setup_page()
+df = load_data()
+
+# --------------------------------------------------
+# Weather Impact Page
+# --------------------------------------------------
+st.title("Weather Impact")
+st.write("This page analyzes how weather variables relate to trip volume.")
+
+required_cols = ["started_at", "TMAX", "TMIN", "PRCP"]
+missing = [c for c in required_cols if c not in df.columns]
+if missing:
+    st.error(f"Missing required columns: {', '.join(missing)}")
+    st.stop()
+
+all_days = daily_weather().index
+min_date = all_days.min().date()
+max_date = all_days.max().date()
+
+start_d, end_d = st.sidebar.date_input(
+    "Date range (Weather page)",
+    value=(min_date, max_date),
+    min_value=min_date,
+    max_value=max_date,
+)
+
+rider_filter = "All"
+if "member_casual" in df.columns:
+    rider_filter = st.sidebar.selectbox("Rider type (Weather page)", ["All", "member", "casual"])
+
+weather_daily = daily_weather(rider_filter).loc[day_range(start_d, end_d)]
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Trips (filtered)", f"{weather_daily['trip_count'].sum():,}")
+col2.metric("Avg temp", f"{weather_daily['avg_temp'].mean():.1f}")
+col3.metric("Avg precip", f"{weather_daily['prcp'].mean():.2f}")
+
+weather_var = st.radio(
+    "Compare trips against:",
+    ["Average Temperature", "Precipitation"],
+    horizontal=True
+)
+
+st.subheader("Relationship Between Weather and Trip Volume")
+fig, ax = plt.subplots(figsize=(8, 5))
+if weather_var == "Average Temperature":
+    ax.scatter(weather_daily["avg_temp"], weather_daily["trip_count"])
+    ax.set_xlabel("Average Temperature")
+    ax.set_ylabel("Daily Trips")
+else:
+    ax.scatter(weather_daily["prcp"], weather_daily["trip_count"])
+    ax.set_xlabel("Precipitation (PRCP)")
+    ax.set_ylabel("Daily Trips")
+st_mpl(fig)
+
+st.subheader("Weather and Trips Over Time")
+if weather_var == "Average Temperature":
+    right_col, right_label = "avg_temp", "Avg Temperature"
+else:
+    right_col, right_label = "prcp", "Precipitation"
+st_dual_axis(
+    weather_daily.index,
+    weather_daily["trip_count"],
+    weather_daily[right_col],
+    "Daily Trips",
+    right_label
+)
+
+with st.expander("Interpretation"):
+    st.markdown(
+        """
+        Warmer temperatures generally align with higher ridership, while precipitation often reduces trips.
+        This supports using forecasts to anticipate demand shifts and schedule rebalancing efficiently.
+        """
+    )
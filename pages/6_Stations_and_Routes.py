@@ -0,0 +1,57 @@
+import streamlit as st
+
+from data import load_data, start_station_counts, end_station_counts, route_counts, route_labels, TOP_N_MAX
+from ui import setup_page, st_barh
+
+setup_page()
+df = load_data()
+
+# --------------------------------------------------
+# Stations & Routes Page
+# --------------------------------------------------
+st.title("Stations & Routes")
+st.write("This page highlights popular stations and frequently used routes.")
+
+required_cols = ["start_station_name", "end_station_name"]
+missing = [c for c in required_cols if c not in df.columns]
+if missing:
+    st.error(f"Missing required columns: {', '.join(missing)}")
+    st.stop()
+
+rider_filter = "All"
+if "member_casual" in df.columns:
+    rider_filter = st.sidebar.selectbox("Rider type (Stations & Routes)", ["All", "member", "casual"])
+
+top_n_stations = st.sidebar.slider("Top stations", 5, TOP_N_MAX, 10)
+top_n_routes = st.sidebar.slider("Top routes", 5, TOP_N_MAX, 10)
+
+all_starts = start_station_counts(rider_filter)
+all_routes = route_counts(rider_filter)
+
+# cached counts are already ranked; reverse the top slice so barh draws the largest on top
+start_counts = all_starts.head(top_n_stations).iloc[::-1]
+end_counts = end_station_counts(rider_filter).head(top_n_stations).iloc[::-1]
+top_routes = all_routes.head(top_n_routes).iloc[::-1]
+top_routes.index = route_labels(top_routes.index)
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Trips", f"{all_starts.sum():,}")
+col2.metric("Unique start stations", f"{len(all_starts):,}")
+col3.metric("Unique routes", f"{len(all_routes):,}")
+
+st.subheader("Top Starting Stations")
+st_barh(start_counts.index, start_counts.to_numpy(), "Trips Started")
+
+st.subheader("Top Ending Stations")
+st_barh(end_counts.index, end_counts.to_numpy(), "Trips Ended")
+
+st.subheader("Most Frequent Routes (Start → End)")
+st_barh(top_routes.index, top_routes.to_numpy(), "Trips")
+
+with st.expander("Interpretation"):
+    st.markdown(
+        """
+        High-frequency stations and routes reveal the system’s core demand hubs and travel corridors.
+        These insights help prioritize rebalancing and capacity planning, especially during peak periods.
+        """
+    )
@@ -0,0 +1,46 @@
+import streamlit as st
+
+from data import load_data, station_balance
+from ui import setup_page, st_barh
+
+setup_page()
+df = load_data()
+
+# --------------------------------------------------
+# Station Balance (Supply Problem)
+# --------------------------------------------------
+st.title("Station Balance (Supply Problem)")
+st.write("Stations that consistently lose or gain bikes (rebalancing needs).")
+
+required_cols = ["start_station_name", "end_station_name"]
+missing = [c for c in required_cols if c not in df.columns]
+if missing:
+    st.error(f"Missing required columns: {', '.join(missing)}")
+    st.stop()
+
+balance_df = station_balance()
+
+top_n = st.sidebar.slider("Number of stations to display (Balance)", 5, 30, 10)
+
+losing = balance_df.sort_values("net_balance").head(top_n)
+gaining = balance_df.sort_values("net_balance", ascending=False).head(top_n)
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Stations analyzed", f"{balance_df.shape[0]:,}")
+col2.metric("Worst net loss", f"{losing['net_balance'].min():,.0f}")
+col3.metric("Worst net gain", f"{gaining['net_balance'].max():,.0f}")
+
+st.subheader("Stations Losing Bikes (Need Rebalancing IN)")
+st_barh(losing["station"], losing["net_balance"], "Net Balance (Starts − Ends)")
+
+st.subheader("Stations Gaining Bikes (Need Rebalancing OUT)")
+st_barh(gaining["station"], gaining["net_balance"], "Net Balance (Starts − Ends)")
+
+with st.expander("Interpretation"):
+    st.markdown(
+        """
+        Stations with large negative values consistently lose bikes and require frequent rebalancing.
+        Stations with large positive values accumulate bikes and risk dock congestion. These insights
+        support rebalancing schedules and capacity planning.
+        """
+    )
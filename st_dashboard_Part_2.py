@@ -28,6 +28,12 @@ page = st.sidebar.selectbox('Select an aspect of the analysis',
 df = pd.read_csv('reduced_data_to_plot_7.csv', index_col = 0)
 top20 = pd.read_csv('top20.csv', index_col = 0)
 
+# Read the exported map once per server process instead of on every rerun
+@st.cache_data
+def load_html(path):
+    with open(path, 'r', encoding = 'utf-8') as f:
+        return f.read()
+
 ######################################### DEFINE THE PAGES #####################################################################
 
 
@@ -113,9 +119,8 @@ elif page == 'Interactive map with aggregated bike trips':
 
     path_to_html = "Divvy Bike Trips Aggregated.html" 
 
-    # Read file and keep in variable
-    with open(path_to_html,'r') as f: 
-        html_data = f.read()
+    # Read file (cached) and keep in variable
+    html_data = load_html(path_to_html)
 
     ## Show in webpage
     st.header("Aggregated Bike Trips in Chicago")
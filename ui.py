@@ -0,0 +1,156 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+
+# --------------------------------------------------
+# App configuration (called at the top of every page)
+# --------------------------------------------------
+def setup_page():
+    st.set_page_config(
+        page_title="NYC CitiBike Dashboard (2022)",
+        layout="wide",
+        initial_sidebar_state="expanded"   # sidebar open so navigation is easy
+    )
+
+
+# --------------------------------------------------
+# Helper: SAFE Matplotlib display (full-width)
+# --------------------------------------------------
+# st_mpl stretches the image to the column width, so screen dpi is enough
+MPL_DPI = 96
+# simplify dense paths and draw long lines in chunks (applied only while rendering)
+MPL_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+
+def st_mpl(fig, dpi=MPL_DPI):
+    """
+    Streamlit-compatible Matplotlib display.
+    Draws the figure once on its Agg canvas and passes the raw RGBA pixels
+    to st.image(), skipping savefig and the second "tight bbox" render.
+    Works even if st.image() does NOT support use_container_width.
+    """
+    import matplotlib.pyplot as plt
+
+    try:
+        fig.set_dpi(dpi)
+        fig.tight_layout()
+        with plt.rc_context(MPL_RC):
+            fig.canvas.draw()
+        img = np.asarray(fig.canvas.buffer_rgba())
+    finally:
+        # always drop the figure from pyplot's registry, even if drawing fails,
+        # so long-running servers don't accumulate figures across reruns
+        plt.close(fig)
+
+    # Older Streamlit: no use_container_width argument
+    try:
+        st.image(img, use_container_width=True)   # newer Streamlit
+    except TypeError:
+        st.image(img, use_column_width=True)      # older Streamlit fallback
+
+
+# --------------------------------------------------
+# Helper: dual-axis line chart (Plotly, rendered in the browser)
+# --------------------------------------------------
+MAX_LINE_POINTS = 1000
+
+
+def _lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the positions of n_out points that preserve the shape of the line.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (n_out - 2)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo = int(i * every) + 1
+        hi = int((i + 1) * every) + 1
+        next_hi = min(int((i + 2) * every) + 1, n)
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+
+        # keep the point forming the largest triangle with the last kept point
+        # and the average of the next bucket
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def _downsample(x, y, n_out=MAX_LINE_POINTS):
+    x, y = pd.Index(x), np.asarray(y, dtype=float)
+    x_num = x.asi8 if isinstance(x, pd.DatetimeIndex) else x.to_numpy()
+    keep = _lttb(np.asarray(x_num, dtype=float), y, n_out)
+    return x[keep], y[keep]
+
+
+def st_dual_axis(x, y_left, y_right, left_label, right_label, height=400):
+    """
+    Two lines sharing the x axis: y_left solid on the left axis,
+    y_right dashed on the right axis. Uses WebGL traces (Scattergl),
+    each downsampled with LTTB to at most MAX_LINE_POINTS points.
+    """
+    from plotly.subplots import make_subplots
+    import plotly.graph_objects as go
+
+    x_left, y_left = _downsample(x, y_left)
+    x_right, y_right = _downsample(x, y_right)
+
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(
+        go.Scattergl(x=x_left, y=y_left, name=left_label, mode="lines"),
+        secondary_y=False
+    )
+    fig.add_trace(
+        go.Scattergl(x=x_right, y=y_right, name=right_label, mode="lines", line={"dash": "dash"}),
+        secondary_y=True
+    )
+    fig.update_xaxes(title_text="Date")
+    fig.update_yaxes(title_text=left_label, secondary_y=False)
+    fig.update_yaxes(title_text=right_label, secondary_y=True)
+    fig.update_layout(height=height)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+# --------------------------------------------------
+# Helper: horizontal bar chart (Plotly, rendered in the browser)
+# --------------------------------------------------
+def st_barh(labels, values, x_label, y_label=None, title=None):
+    """
+    Horizontal bars, first label at the bottom (pass ranked data reversed
+    to draw the largest on top). Height grows with the number of bars.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(x=values, y=labels, orientation="h"))
+    fig.update_xaxes(title_text=x_label)
+    # categorical axis: keep duplicate-looking numbers and the given order as-is
+    fig.update_yaxes(title_text=y_label, type="category", automargin=True)
+    fig.update_layout(title=title, height=120 + 24 * len(labels), margin={"t": 40 if title else 20})
+    st.plotly_chart(fig, use_container_width=True)
+
+
+# --------------------------------------------------
+# Helper: vertical bar chart (Plotly, rendered in the browser)
+# --------------------------------------------------
+def st_bar(labels, values, x_label, y_label=None, height=400):
+    """Vertical bars in the given label order (e.g. month names or hours)."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(x=labels, y=values))
+    # categorical axis: keep the given order instead of sorting the labels
+    fig.update_xaxes(title_text=x_label, type="category")
+    fig.update_yaxes(title_text=y_label)
+    fig.update_layout(height=height, margin={"t": 20})
+    st.plotly_chart(fig, use_container_width=True)